@@ -1,9 +1,10 @@
 """Persona agent - maintains human-like persona in conversations."""
 import random
-from groq import Groq
 from app.models.session_state import Message
 from app.models.strategy import StrategyDecision, ConversationGoal
 from app.config import config
+from app.core.groq_client import get_async_groq_client
+from app.core.llm_batcher import llm_batcher
 from app.utils.logger import logger
 from app.utils.prompts import PersonaAgentPrompts, FallbackResponses, ForbiddenPhrases, AllowedFillers
 
@@ -20,26 +21,18 @@ class PersonaAgent:
     """
     
     def __init__(self):
-        # Initialize Groq client
-        if config.GROQ_API_KEY:
-            try:
-                self.client = Groq(api_key=config.GROQ_API_KEY)
-                self.model_name = config.GROQ_MODEL
-            except Exception as e:
-                logger.warning(f"PersonaAgent: Failed to initialize Groq: {e}")
-                self.client = None
-                self.model_name = None
-        else:
-            self.client = None
-            self.model_name = None
-        
+        # Use the shared Groq client (one connection pool per process)
+        self.client = get_async_groq_client()
+        self.model_name = config.GROQ_MODEL if self.client else None
+
         self.persona_traits = PersonaAgentPrompts.PERSONA_TRAITS
     
-    def generate_response(
+    async def generate_response(
         self,
         message: Message,
         conversation_history: list[Message],
-        strategy_decision: StrategyDecision
+        strategy_decision: StrategyDecision,
+        history_summary: str = ""
     ) -> str:
         """
         Generate human-like response based on strategy decision.
@@ -63,12 +56,14 @@ class PersonaAgent:
         conversation_context = PersonaAgentPrompts.build_conversation_context(
             system_prompt=system_prompt,
             conversation_history=conversation_history,
-            current_message=message.text
+            current_message=message.text,
+            history_summary=history_summary
         )
         
         try:
             # Generate response using Groq with tuned params for persona
-            response = self.client.chat.completions.create(
+            response = await llm_batcher.submit(
+                self.client,
                 model=self.model_name,
                 messages=[
                     {"role": "user", "content": conversation_context}
@@ -162,19 +157,8 @@ class PersonaAgent:
     
     def _has_forbidden_phrases(self, text: str) -> bool:
         """Check if response contains forbidden phrases."""
-        text_lower = text.lower()
-        
-        # Check forbidden phrases
-        for phrase in ForbiddenPhrases.FORBIDDEN:
-            if phrase.lower() in text_lower:
-                return True
-        
-        # Check meta phrases
-        for phrase in ForbiddenPhrases.META_PHRASES:
-            if phrase.lower() in text_lower:
-                return True
-        
-        return False
+        # Single multi-pattern scan instead of a loop over every phrase
+        return ForbiddenPhrases.contains_any(text)
     
     def _fallback_response(
         self,
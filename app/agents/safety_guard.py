@@ -20,15 +20,14 @@ class SafetyGuard:
         """
         response_lower = response.lower()
         
-        # Check centralized forbidden phrases (from prompts.py)
-        for forbidden in self.forbidden_phrases.FORBIDDEN:
-            if forbidden.lower() in response_lower:
-                return False, f"Response contains forbidden phrase: {forbidden}"
-        
-        # Check meta phrases (reveal intelligence awareness)
-        for meta in self.forbidden_phrases.META_PHRASES:
-            if meta.lower() in response_lower:
-                return False, f"Response contains meta phrase: {meta}"
+        # Check centralized forbidden/meta phrases (from prompts.py) -
+        # one compiled-regex pass over the response instead of a loop
+        # per phrase, and it reports which phrase matched
+        matched = self.forbidden_phrases.search(response)
+        if matched is not None:
+            if matched in self.forbidden_phrases.META_PHRASES:
+                return False, f"Response contains meta phrase: {matched}"
+            return False, f"Response contains forbidden phrase: {matched}"
         
         # Check for prohibited phrases that reveal detection (legacy)
         for prohibited in self.prohibited_phrases.PROHIBITED_RESPONSES:
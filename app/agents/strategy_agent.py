@@ -1,21 +1,25 @@
 """Strategy agent - decides conversation strategy and when to engage/terminate."""
+from operator import attrgetter
 from typing import Optional
-from groq import Groq
+from groq import AsyncGroq
 from app.models.session_state import Message, SessionState
 from app.models.strategy import StrategyDecision, ConversationGoal
 from app.config import config
+from app.core.groq_client import get_async_groq_client
+from app.core.llm_batcher import llm_batcher
+from app.core.llm_cache import llm_response_cache
 from app.utils.logger import logger
 from app.utils.prompts import StrategyAgentPrompts
 
 
+# C-level (sender, text) extraction for the summary loop
+_SENDER_TEXT = attrgetter("sender", "text")
+
+
 class StrategyAgent:
     """Decides conversation strategy and when to engage/terminate."""
     
-    def __init__(self):
-        # Lazy initialization of Groq client for LLM-based conversation end detection
-        self._groq_client: Optional[Groq] = None
-    
-    def decide_strategy(
+    async def decide_strategy(
         self,
         session: SessionState,
         message: Message
@@ -41,13 +45,14 @@ class StrategyAgent:
                 reasoning="No scam detected"
             )
         
-        # Analyze intelligence to determine strategy
+        # Analyze intelligence to determine strategy - truthiness on the
+        # bound sets, no per-field len() calls
         intelligence = session.extractedIntelligence
-        has_intelligence = (
-            len(intelligence.bankAccounts) > 0 or
-            len(intelligence.upiIds) > 0 or
-            len(intelligence.phishingLinks) > 0 or
-            len(intelligence.phoneNumbers) > 0
+        has_intelligence = bool(
+            intelligence.bankAccounts
+            or intelligence.upiIds
+            or intelligence.phishingLinks
+            or intelligence.phoneNumbers
         )
         
         # Determine conversation goal based on context
@@ -58,7 +63,7 @@ class StrategyAgent:
         if goal == ConversationGoal.WRAP_UP:
             # Already decided to wrap up based on intelligence/context - check for explicit end signals
             if config.USE_LLM_FOR_CONVERSATION_END and session.totalMessagesExchanged > 1:
-                should_end = self._llm_detect_conversation_end(message, session)
+                should_end = await self._llm_detect_conversation_end(message, session)
                 if should_end:
                     return StrategyDecision(
                         should_engage=False,
@@ -154,26 +159,20 @@ class StrategyAgent:
         else:  # WRAP_UP
             return "Sufficient intelligence gathered or conversation should end"
     
-    def should_continue_engagement(
+    async def should_continue_engagement(
         self,
         session: SessionState,
         message: Message
     ) -> bool:
         """Legacy method for backward compatibility."""
-        decision = self.decide_strategy(session, message)
+        decision = await self.decide_strategy(session, message)
         return decision.should_engage
-    
-    def _get_groq_client(self) -> Optional[Groq]:
-        """Get or initialize Groq client for conversation end detection."""
-        if self._groq_client is None and config.GROQ_API_KEY:
-            try:
-                self._groq_client = Groq(api_key=config.GROQ_API_KEY)
-            except Exception as e:
-                logger.warning(f"StrategyAgent: Failed to initialize Groq: {e}")
-                return None
-        return self._groq_client
-    
-    def _llm_detect_conversation_end(
+
+    def _get_groq_client(self) -> Optional[AsyncGroq]:
+        """Get the shared Groq client for conversation end detection."""
+        return get_async_groq_client()
+
+    async def _llm_detect_conversation_end(
         self,
         message: Message,
         session: SessionState
@@ -212,18 +211,26 @@ class StrategyAgent:
             link_count=len(session.extractedIntelligence.phishingLinks)
         )
         
+        # Repeated scammer messages are common; reuse the cached decision
+        # for an identical prompt instead of paying another round trip.
+        cache_key = llm_response_cache.make_key(config.GROQ_MODEL, prompt)
+        decision = llm_response_cache.get(cache_key)
+
         try:
-            response = groq_client.chat.completions.create(
-                model=config.GROQ_MODEL,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,  # Very low temperature for deterministic thinking
-                max_tokens=10,  # Binary output only
-                top_p=0.5  # Focused output
-            )
-            
-            decision = response.choices[0].message.content.strip().upper()
+            if decision is None:
+                response = await llm_batcher.submit(
+                    groq_client,
+                    model=config.GROQ_MODEL,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.1,  # Very low temperature for deterministic thinking
+                    max_tokens=10,  # Binary output only
+                    top_p=0.5  # Focused output
+                )
+
+                decision = response.choices[0].message.content.strip().upper()
+                llm_response_cache.set(cache_key, decision)
             should_end = decision == "YES"
             
             logger.info(
@@ -248,15 +255,12 @@ class StrategyAgent:
         """Build a summary of the conversation for LLM context."""
         if not session.conversationHistory:
             return "No previous messages"
-        
-        # Get last few messages for context
-        recent_messages = session.conversationHistory[-5:]
-        summary = "Recent messages:\n"
-        
-        for msg in recent_messages:
-            summary += f"- {msg.sender}: {msg.text}\n"
-        
-        return summary
+
+        lines = [
+            f"- {sender}: {text}"
+            for sender, text in map(_SENDER_TEXT, session.conversationHistory[-5:])
+        ]
+        return "Recent messages:\n" + "\n".join(lines) + "\n"
     
     def should_send_callback(self, session: SessionState) -> bool:
         """Determine if we should send callback to GUVI."""
@@ -268,12 +272,10 @@ class StrategyAgent:
         
         # Check if we have meaningful intelligence
         intelligence = session.extractedIntelligence
-        has_intelligence = (
-            len(intelligence.bankAccounts) > 0 or
-            len(intelligence.upiIds) > 0 or
-            len(intelligence.phishingLinks) > 0 or
-            len(intelligence.phoneNumbers) > 0 or
-            len(intelligence.suspiciousKeywords) > 0
+        return bool(
+            intelligence.bankAccounts
+            or intelligence.upiIds
+            or intelligence.phishingLinks
+            or intelligence.phoneNumbers
+            or intelligence.suspiciousKeywords
         )
-        
-        return has_intelligence
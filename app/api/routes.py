@@ -110,7 +110,7 @@ async def process_message(
         if is_scam:
             # Process message through orchestrator
             # Orchestrator handles: Intelligence (parallel) -> Strategy -> Persona -> Safety
-            agent_response = orchestrator.process_message(
+            agent_response = await orchestrator.process_message(
                 request.message,
                 session
             )
@@ -0,0 +1,37 @@
+"""Shared Groq client singletons.
+
+Each Groq client holds its own HTTP connection pool; having every agent
+construct one defeats keep-alive reuse and multiplies TLS handshakes.
+All components should fetch the shared client from here instead.
+"""
+from typing import Optional
+
+from groq import AsyncGroq, Groq
+
+from app.config import config
+from app.utils.logger import logger
+
+_async_client: Optional[AsyncGroq] = None
+_sync_client: Optional[Groq] = None
+
+
+def get_async_groq_client() -> Optional[AsyncGroq]:
+    """Get the process-wide AsyncGroq client (None if unconfigured)."""
+    global _async_client
+    if _async_client is None and config.GROQ_API_KEY:
+        try:
+            _async_client = AsyncGroq(api_key=config.GROQ_API_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to initialize shared AsyncGroq client: {e}")
+    return _async_client
+
+
+def get_sync_groq_client() -> Optional[Groq]:
+    """Get the process-wide blocking Groq client (None if unconfigured)."""
+    global _sync_client
+    if _sync_client is None and config.GROQ_API_KEY:
+        try:
+            _sync_client = Groq(api_key=config.GROQ_API_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to initialize shared Groq client: {e}")
+    return _sync_client
@@ -1,110 +1,242 @@
 """Intelligence aggregation and management."""
+import hashlib
 import re
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 from app.models.session_state import Message
 from app.models.intelligence import ExtractedIntelligence
 from app.utils.regex_patterns import RegexPatterns
 from app.utils.keyword_lists import ScamKeywords
+from app.utils.logger import logger
+
+
+# Precomputed translate tables for separator stripping - str.translate is
+# a single C pass over the string, cheaper than a regex substitution for
+# these fixed character classes.
+_CLEAN_TABLE = str.maketrans('', '', '-. \t\n\r\f\v')
+_PHONE_SEP_TABLE = str.maketrans('', '', ' \t\n\r\f\v-()')
+
+
+# Country-code stripping rules: (prefix, required length or None, chars to
+# strip). A small table walked in order replaces the if/elif prefix chain -
+# one predictable loop, and the rules live in one place.
+_PHONE_PREFIX_RULES = (
+    ('+91', None, 3),
+    ('91', 12, 2),
+    ('0', 11, 1),
+)
+
+
+# Bound on the cross-session extraction cache (LRU eviction). Scammer
+# scripts repeat the same boilerplate messages across unrelated sessions,
+# so unique texts are few relative to total traffic.
+_TEXT_CACHE_MAX = 4096
+
+
+# Case-insensitive probe for URLs in the cheap pre-extraction gate -
+# avoids allocating a lowercased copy of the whole text just to look
+# for "http".
+_HTTP_RE = re.compile('http', re.IGNORECASE)
+
+
+def _normalize_phone(cleaned: str) -> str:
+    """Normalize a separator-stripped phone number to +91XXXXXXXXXX.
+
+    Returns an empty string if the number doesn't look like a valid
+    10-digit Indian mobile number after prefix stripping.
+    """
+    for prefix, required_len, strip in _PHONE_PREFIX_RULES:
+        if cleaned.startswith(prefix) and (
+            required_len is None or len(cleaned) == required_len
+        ):
+            cleaned = cleaned[strip:]
+            break
+    # Validate: should be 10 digits starting with 6-9
+    if len(cleaned) == 10 and cleaned[0] in '6789':
+        return f"+91{cleaned}"
+    return ""
 
 
 class IntelligenceAggregator:
     """Aggregates intelligence from multiple sources."""
-    
+
     def __init__(self):
         self.patterns = RegexPatterns()
         self.keywords = ScamKeywords()
-    
+        # Keywords are matched against lowercased text; lowercase them once
+        # here instead of on every extraction call.
+        self._suspicious_keywords = [
+            kw.lower() for kw in self.keywords.SUSPICIOUS_KEYWORDS
+        ]
+        # Multi-pattern keyword automaton: one O(N) pass over the text
+        # instead of one substring scan per keyword. Falls back to the
+        # plain loop if pyahocorasick isn't installed.
+        self._keyword_automaton = None
+        # Case-insensitive alternation for the no-automaton path: scans
+        # the original text directly, so no full lowercased copy of the
+        # input is allocated per extraction. Longest keywords first so
+        # the engine prefers the most specific match.
+        self._keyword_re = re.compile(
+            '|'.join(
+                sorted(
+                    map(re.escape, self._suspicious_keywords),
+                    key=len,
+                    reverse=True,
+                )
+            ),
+            re.IGNORECASE,
+        )
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for kw in self._suspicious_keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
+        # Cross-session dedup: extraction results per unique message text,
+        # keyed by content hash. Identical scammer boilerplate ("Your
+        # account is suspended...") is extracted once process-wide no
+        # matter how many sessions it appears in. Keyed on whole messages,
+        # not lines - the phone/bank patterns match across newlines, so
+        # chunking below message granularity would drop artifacts that
+        # span a line break.
+        self._text_cache: OrderedDict = OrderedDict()
+        # Extraction runs on executor threads (asyncio.to_thread in the
+        # orchestrator), so the get/move_to_end and evict/insert sequences
+        # on the shared OrderedDict must be atomic.
+        self._cache_lock = threading.Lock()
+
     def extract_intelligence(
         self,
         message: Message,
-        conversation_history: List[Message]
+        conversation_history: List[Message],
+        prior: Optional[ExtractedIntelligence] = None,
+        scanned_through: int = 0
     ) -> ExtractedIntelligence:
-        """Extract intelligence from message and conversation."""
+        """Extract intelligence from message and conversation.
+
+        When ``prior`` (the intelligence already cached on the session) is
+        given, the scan covers the new message plus any history messages
+        past ``scanned_through`` (the session's extraction watermark) and
+        the result is unioned with it. History can contain turns extraction
+        never saw - non-scam turns skip the orchestrator, and the API
+        replaces the history wholesale from the request - so ``prior``
+        alone is not a substitute for scanning the tail. With the
+        watermark kept current, turn N still does O(new messages) work
+        instead of re-scanning O(N) history.
+        """
+        if prior is not None:
+            unscanned = conversation_history[scanned_through:]
+            # Gate: trivial messages ("ok", "thanks") have nothing to
+            # extract - when there's no unscanned tail either, skip the
+            # regex/keyword machinery entirely and return the cache
+            if not unscanned and not self._likely_has_intel(message.text):
+                logger.debug("Intelligence extraction skipped: no extractable signal")
+                return prior
+            texts = [message.text] + [m.text for m in unscanned]
+        else:
+            texts = [message.text] + [m.text for m in conversation_history[-5:]]
+
         intelligence = ExtractedIntelligence()
-        text = message.text
-        
-        # Extract bank accounts
-        bank_accounts = self.patterns.BANK_ACCOUNT.findall(text)
-        intelligence.bankAccounts.extend([
-            re.sub(r'[-.\s]', '', acc) for acc in bank_accounts
-        ])
-        
-        # Extract UPI IDs
-        upi_ids = self.patterns.UPI_ID.findall(text)
-        intelligence.upiIds.extend(upi_ids)
-        
-        # Extract phone numbers with improved normalization
-        phone_numbers = self.patterns.PHONE_NUMBER.findall(text)
-        normalized_phones = []
-        for num in phone_numbers:
-            # Remove spaces, dashes, and other separators
-            cleaned = re.sub(r'[\s\-\(\)]', '', num)
-            # Remove country code prefixes if present
-            if cleaned.startswith('+91'):
-                cleaned = cleaned[3:]
-            elif cleaned.startswith('91') and len(cleaned) == 12:
-                cleaned = cleaned[2:]
-            elif cleaned.startswith('0') and len(cleaned) == 11:
-                cleaned = cleaned[1:]
-            # Validate: should be 10 digits starting with 6-9
-            if len(cleaned) == 10 and cleaned[0] in '6789':
-                normalized_phones.append(f"+91{cleaned}")
-        intelligence.phoneNumbers.extend(normalized_phones)
-        
-        # Extract phishing links
-        urls = self.patterns.URL.findall(text)
-        intelligence.phishingLinks.extend(urls)
-        
-        # Extract suspicious keywords
-        text_lower = text.lower()
-        found_keywords = [
-            keyword for keyword in self.keywords.SUSPICIOUS_KEYWORDS
-            if keyword in text_lower
-        ]
-        intelligence.suspiciousKeywords.extend(found_keywords)
-        
-        # Also check conversation history for intelligence
-        for hist_msg in conversation_history[-5:]:  # Check last 5 messages
-            hist_text = hist_msg.text
-            
-            # Extract from history
-            hist_banks = self.patterns.BANK_ACCOUNT.findall(hist_text)
-            intelligence.bankAccounts.extend([
-                re.sub(r'[-.\s]', '', acc) for acc in hist_banks
-            ])
-            
-            hist_upi = self.patterns.UPI_ID.findall(hist_text)
-            intelligence.upiIds.extend(hist_upi)
-            
-            hist_phones = self.patterns.PHONE_NUMBER.findall(hist_text)
-            normalized_hist_phones = []
-            for num in hist_phones:
-                # Remove spaces, dashes, and other separators
-                cleaned = re.sub(r'[\s\-\(\)]', '', num)
-                # Remove country code prefixes if present
-                if cleaned.startswith('+91'):
-                    cleaned = cleaned[3:]
-                elif cleaned.startswith('91') and len(cleaned) == 12:
-                    cleaned = cleaned[2:]
-                elif cleaned.startswith('0') and len(cleaned) == 11:
-                    cleaned = cleaned[1:]
-                # Validate: should be 10 digits starting with 6-9
-                if len(cleaned) == 10 and cleaned[0] in '6789':
-                    normalized_hist_phones.append(f"+91{cleaned}")
-            intelligence.phoneNumbers.extend(normalized_hist_phones)
-            
-            hist_urls = self.patterns.URL.findall(hist_text)
-            intelligence.phishingLinks.extend(hist_urls)
-        
-        # Remove duplicates
-        intelligence.bankAccounts = list(set(intelligence.bankAccounts))
-        intelligence.upiIds = list(set(intelligence.upiIds))
-        intelligence.phoneNumbers = list(set(intelligence.phoneNumbers))
-        intelligence.phishingLinks = list(set(intelligence.phishingLinks))
-        intelligence.suspiciousKeywords = list(set(intelligence.suspiciousKeywords))
-        
+
+        # Scan each message text through the content cache: repeated
+        # boilerplate messages hit the cache instead of re-running the
+        # pattern extraction.
+        bank_accounts: set = set()
+        upi_ids: set = set()
+        phone_numbers: set = set()
+        urls: set = set()
+        for text in texts:
+            if not text.strip():
+                continue
+            banks, upis, phones, links = self._extract_text(text)
+            bank_accounts.update(banks)
+            upi_ids.update(upis)
+            phone_numbers.update(phones)
+            urls.update(links)
+
+        # Extract suspicious keywords (current message only)
+        keywords = set(self._find_keywords(message.text))
+
+        # Union with what earlier turns already extracted
+        if prior is not None:
+            bank_accounts.update(prior.bankAccounts)
+            upi_ids.update(prior.upiIds)
+            phone_numbers.update(prior.phoneNumbers)
+            urls.update(prior.phishingLinks)
+            keywords.update(prior.suspiciousKeywords)
+
+        intelligence.bankAccounts = bank_accounts
+        intelligence.upiIds = upi_ids
+        intelligence.phoneNumbers = phone_numbers
+        intelligence.phishingLinks = urls
+        intelligence.suspiciousKeywords = keywords
+
         return intelligence
 
+    def _extract_text(self, text: str):
+        """Run pattern extraction on one message text, memoized by content hash.
+
+        Returns a ``(bank_accounts, upi_ids, phone_numbers, urls)`` tuple
+        of frozensets. Cached process-wide so identical texts - common
+        when scammers reuse scripts across sessions - cost one BLAKE2
+        hash instead of a full regex pass.
+        """
+        key = hashlib.blake2b(
+            text.encode('utf-8', 'surrogatepass'), digest_size=16
+        ).digest()
+        with self._cache_lock:
+            cached = self._text_cache.get(key)
+            if cached is not None:
+                self._text_cache.move_to_end(key)
+                return cached
+
+        banks = frozenset(
+            acc.translate(_CLEAN_TABLE)
+            for acc in self.patterns.BANK_ACCOUNT.findall(text)
+        )
+        upis = frozenset(self.patterns.UPI_ID.findall(text))
+        phones = frozenset(
+            normalized
+            for num in self.patterns.PHONE_NUMBER.findall(text)
+            if (normalized := _normalize_phone(num.translate(_PHONE_SEP_TABLE)))
+        )
+        links = frozenset(self.patterns.URL.findall(text))
+
+        result = (banks, upis, phones, links)
+        with self._cache_lock:
+            if len(self._text_cache) >= _TEXT_CACHE_MAX:
+                self._text_cache.popitem(last=False)
+            self._text_cache[key] = result
+        return result
+
+    def _likely_has_intel(self, text: str) -> bool:
+        """Cheap scan for anything worth extracting from the text."""
+        return (
+            any(c.isdigit() for c in text)
+            or '@' in text
+            or _HTTP_RE.search(text) is not None
+            or bool(self._find_keywords(text))
+        )
+
+    def _find_keywords(self, text: str) -> List[str]:
+        """Find all suspicious keywords in text, case-insensitively.
+
+        Returns the canonical (lowercased) keyword forms.
+        """
+        if self._keyword_automaton is not None:
+            # pyahocorasick has no caseless mode, so this path still
+            # lowercases once before the single automaton pass
+            return list({kw for _, kw in self._keyword_automaton.iter(text.lower())})
+        # IGNORECASE alternation scans the original text - only the few
+        # matches get lowercased, not the whole input
+        return list({m.lower() for m in self._keyword_re.findall(text)})
+
 
 # Global aggregator instance
 intelligence_aggregator = IntelligenceAggregator()
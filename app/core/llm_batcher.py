@@ -0,0 +1,96 @@
+"""Micro-batching queue for LLM calls."""
+import asyncio
+from typing import Any, Optional
+
+
+class LLMBatcher:
+    """Coalesces concurrent LLM calls into gathered batches.
+
+    Calls submitted within ``batch_window`` seconds of each other (up to
+    ``max_batch`` at a time) are dispatched together with asyncio.gather,
+    so concurrent sessions share the client's keep-alive connections
+    instead of serializing round trips. Groq has no server-side batch
+    endpoint yet, so the win here is connection reuse and overlap.
+    """
+
+    def __init__(self, batch_window: float = 0.005, max_batch: int = 8):
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        # Strong references to in-flight dispatch tasks so the event loop
+        # can't garbage-collect them mid-flight
+        self._dispatches: set = set()
+
+    async def submit(self, client, **params) -> Any:
+        """Queue a chat.completions.create call and await its response.
+
+        Args:
+            client: AsyncGroq client to dispatch through
+            **params: keyword arguments for chat.completions.create
+
+        Returns:
+            The completion response (exceptions propagate to the caller).
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((client, params, future))
+        self._ensure_worker()
+        return await future
+
+    def _ensure_worker(self):
+        """Start the background dispatch task if it isn't running."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                # Idle - let the worker exit; submit() restarts it. An item
+                # can land between the timeout firing and this task
+                # finishing (submit() would see a not-yet-done worker and
+                # never restart it), so only exit on a confirmed-empty queue.
+                if self._queue.empty():
+                    return
+                continue
+
+            # Collect whatever else arrives within the batch window
+            batch = [item]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # Fire the batch without awaiting it - awaiting here would make
+            # every later arrival wait out this batch's full LLM round
+            # trip (head-of-line blocking). The worker goes straight back
+            # to collecting while the batch runs as its own task.
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch):
+        """Fire all calls in the batch concurrently."""
+        async def _one(client, params, future):
+            try:
+                result = await client.chat.completions.create(**params)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+
+        await asyncio.gather(*(_one(c, p, f) for c, p, f in batch))
+
+
+# Global batcher instance
+llm_batcher = LLMBatcher()
@@ -0,0 +1,51 @@
+"""In-process TTL cache for LLM responses."""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class LLMResponseCache:
+    """Small TTL + LRU cache for deterministic LLM call results.
+
+    Scammers frequently repeat identical messages ("verify immediately",
+    "send OTP"); a hit here turns a full network round trip into a dict
+    lookup. Only low-temperature decision calls should be cached - persona
+    responses want variety and must not go through this.
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> bytes:
+        """Build a cache key from model + whitespace/case-normalized prompt."""
+        normalized = " ".join(prompt.lower().split())
+        return hashlib.blake2b(
+            f"{model}\x00{normalized}".encode(), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Any):
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# Global response cache instance
+llm_response_cache = LLMResponseCache()
@@ -3,14 +3,15 @@ Agent orchestrator - coordinates multiple AI agents with proper execution model.
 
 Execution Model:
 1. Intelligence Extraction Agent - PARALLEL (non-blocking, read-only)
-2. Strategy Agent - SEQUENTIAL (decides intent/goal)
+2. Strategy Agent - PARALLEL with extraction (decides intent/goal)
 3. Persona Agent - SEQUENTIAL (expresses intent)
 4. Safety Guard - SEQUENTIAL (final gatekeeper)
 """
 import asyncio
 from typing import Optional
 from app.models.session_state import Message, SessionState
-from app.models.strategy import StrategyDecision
+from app.models.strategy import StrategyDecision, ConversationGoal
+from app.models.intelligence import ExtractedIntelligence
 from app.core.session_manager import session_manager
 from app.core.intelligence_aggregator import intelligence_aggregator
 from app.agents.persona_agent import PersonaAgent
@@ -24,52 +25,74 @@ class Orchestrator:
     Orchestrates all agents to handle scam engagement.
     
     Implements agent-by-agent execution model:
-    - Intelligence extraction runs in parallel (non-blocking)
-    - Strategy, Persona, and Safety run sequentially
+    - Intelligence extraction and strategy run in parallel (asyncio.gather)
+    - Persona and Safety run sequentially afterwards
     """
     
     def __init__(self):
         self.persona_agent = PersonaAgent()
         self.strategy_agent = StrategyAgent()
     
-    def process_message(
+    async def process_message(
         self,
         message: Message,
         session: SessionState
     ) -> Optional[str]:
         """
         Process incoming message and generate response.
-        
+
         Execution flow:
-        1. PARALLEL: Extract intelligence (non-blocking)
-        2. SEQUENTIAL: Strategy agent decides goal
-        3. SEQUENTIAL: Persona agent expresses goal
-        4. SEQUENTIAL: Safety guard validates response
-        
+        1. PARALLEL: Extract intelligence + strategy decision (asyncio.gather)
+        2. SEQUENTIAL: Persona agent expresses goal
+        3. SEQUENTIAL: Safety guard validates response
+
         Returns:
             Response message if agent should engage, None otherwise
         """
         # ============================================================
-        # STEP 1: INTELLIGENCE EXTRACTION (PARALLEL/NON-BLOCKING)
+        # STEP 1+2: INTELLIGENCE EXTRACTION + STRATEGY (PARALLEL)
         # ============================================================
-        # This runs early and conceptually in parallel
-        # It's read-only and doesn't affect response generation
-        intelligence = self._extract_intelligence_parallel(message, session)
-        
+        # Intelligence extraction is read-only and doesn't affect response
+        # generation; strategy only depends on the incoming message and
+        # session counters - both are independent, so overlap them.
+        intel_task = asyncio.create_task(
+            asyncio.to_thread(self._extract_intelligence_parallel, message, session)
+        )
+        strategy_task = asyncio.create_task(
+            self.strategy_agent.decide_strategy(session, message)
+        )
+        intelligence, strategy_decision = await asyncio.gather(
+            intel_task, strategy_task
+        )
+
+        # None signals extraction failure. Treat it as "nothing new this
+        # turn" for the pipeline, but remember it so the watermark stays
+        # put and the failed turn is re-scanned next time.
+        extraction_failed = intelligence is None
+        if extraction_failed:
+            intelligence = ExtractedIntelligence()
+
+        # Diff against the session cache BEFORE merging so notes later in
+        # the pipeline only cover intelligence that is new this turn
+        new_intelligence = self._diff_intelligence(
+            session.extractedIntelligence, intelligence
+        )
+
         # Update session with extracted intelligence (non-blocking operation)
         session_manager.update_session(
             session.sessionId,
             message,
             intelligence=intelligence
         )
-        
-        # ============================================================
-        # STEP 2: STRATEGY AGENT (SEQUENTIAL - PLANNER)
-        # ============================================================
-        # This agent DECIDES the conversation goal/intent
-        # Must run before Persona Agent to avoid conflicting outputs
-        strategy_decision = self.strategy_agent.decide_strategy(session, message)
-        
+
+        # Extraction has now seen everything up to and including the
+        # message appended above - advance the watermark so the next turn
+        # only scans history it hasn't covered. A failed extraction must
+        # NOT advance it: the message would land below the watermark and
+        # its artifacts would never be re-scanned.
+        if not extraction_failed:
+            session.intelScannedThroughIndex = len(session.conversationHistory)
+
         logger.info(
             f"Strategy decision for session {session.sessionId}: "
             f"goal={strategy_decision.goal.value}, "
@@ -79,7 +102,6 @@ class Orchestrator:
         # If strategy says don't engage (conversation ending), mark for callback
         if not strategy_decision.should_engage:
             # Conversation is ending - mark session for callback
-            from app.models.strategy import ConversationGoal
             if strategy_decision.goal == ConversationGoal.WRAP_UP:
                 session.conversationEnded = True
             return None
@@ -89,10 +111,11 @@ class Orchestrator:
         # ============================================================
         # This agent EXPRESSES the strategy, doesn't decide it
         # Runs after Strategy Agent to ensure consistent output
-        response = self.persona_agent.generate_response(
+        response = await self.persona_agent.generate_response(
             message,
             session.conversationHistory,
-            strategy_decision
+            strategy_decision,
+            history_summary=session.historySummary
         )
         
         if not response:
@@ -116,12 +139,12 @@ class Orchestrator:
                 f"Safety guard triggered: {error}"
             )
         
-        # Add agent notes about extracted intelligence
-        self._add_intelligence_notes(session, intelligence)
+        # Add agent notes about newly extracted intelligence only - turns
+        # that surfaced nothing new don't re-note items from earlier turns
+        self._add_intelligence_notes(session, new_intelligence)
         
         # Check if strategy indicates conversation should end
         # If goal is WRAP_UP, mark conversation as ended
-        from app.models.strategy import ConversationGoal
         if strategy_decision.goal == ConversationGoal.WRAP_UP:
             session.conversationEnded = True
             logger.info(f"Conversation marked as ended for session {session.sessionId}")
@@ -140,42 +163,66 @@ class Orchestrator:
         - Never blocks response generation
         - Runs on every message, including failures
         - Does not affect conversational flow
+
+        Returns None on failure so the caller can skip the watermark
+        advance and retry the turn's history on the next extraction.
         """
         try:
-            # Extract intelligence (fast, non-blocking operation)
+            # Extract intelligence (fast, non-blocking operation).
+            # Pass the session's cached intelligence plus the extraction
+            # watermark so only the new message and the not-yet-scanned
+            # history tail are processed - earlier non-scam turns and
+            # request-supplied history never went through extraction.
             intelligence = intelligence_aggregator.extract_intelligence(
                 message,
-                session.conversationHistory
+                session.conversationHistory,
+                prior=session.extractedIntelligence,
+                scanned_through=session.intelScannedThroughIndex
             )
             return intelligence
         except Exception as e:
             # Even if extraction fails, don't block the conversation
             logger.error(f"Intelligence extraction failed (non-blocking): {e}")
-            from app.models.intelligence import ExtractedIntelligence
-            return ExtractedIntelligence()  # Return empty intelligence
+            return None  # Signal failure - caller keeps the watermark put
     
+    @staticmethod
+    def _diff_intelligence(
+        prior: ExtractedIntelligence,
+        current: ExtractedIntelligence
+    ) -> ExtractedIntelligence:
+        """Return the intelligence present in current but not in prior."""
+        return ExtractedIntelligence(
+            bankAccounts=current.bankAccounts - prior.bankAccounts,
+            upiIds=current.upiIds - prior.upiIds,
+            phishingLinks=current.phishingLinks - prior.phishingLinks,
+            phoneNumbers=current.phoneNumbers - prior.phoneNumbers,
+            suspiciousKeywords=(
+                current.suspiciousKeywords - prior.suspiciousKeywords
+            ),
+        )
+
     def _add_intelligence_notes(
         self,
         session: SessionState,
         intelligence
     ):
-        """Add notes about extracted intelligence."""
+        """Add notes about intelligence newly extracted this turn."""
         if intelligence.phishingLinks:
             session_manager.add_agent_note(
                 session.sessionId,
-                f"Extracted phishing link: {intelligence.phishingLinks[-1]}"
+                f"Extracted phishing link: {next(iter(intelligence.phishingLinks))}"
             )
-        
+
         if intelligence.upiIds:
             session_manager.add_agent_note(
                 session.sessionId,
-                f"Extracted UPI ID: {intelligence.upiIds[-1]}"
+                f"Extracted UPI ID: {next(iter(intelligence.upiIds))}"
             )
-        
+
         if intelligence.phoneNumbers:
             session_manager.add_agent_note(
                 session.sessionId,
-                f"Extracted phone number: {intelligence.phoneNumbers[-1]}"
+                f"Extracted phone number: {next(iter(intelligence.phoneNumbers))}"
             )
 
 
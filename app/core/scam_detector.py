@@ -1,15 +1,71 @@
 """LLM-first scam detection engine with rule-based fallback."""
 from typing import List, Dict, Optional
 import json
-from groq import Groq
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from app.core.groq_client import get_sync_groq_client
 from app.models.session_state import Message
 from app.utils.regex_patterns import RegexPatterns
 from app.utils.keyword_lists import ScamKeywords
+from app.utils.helpers import dedupe_preserve_order
+from app.core.llm_cache import llm_response_cache
 from app.utils.prompts import ScamDetectionPrompts
 from app.config import config
 from app.utils.logger import logger
 
 
+# Last-resort pattern for pulling the verdict object out of malformed
+# output (e.g. unbalanced braces elsewhere in the text); compiled once
+# at import rather than per call.
+_JSON_OBJ_RE = re.compile(r'\{[^{}]*"is_scam"[^{}]*\}', re.DOTALL)
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} substring of text, or None.
+
+    Single O(N) forward scan with no backtracking - replaces the greedy
+    regex search over the model's whole output.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_str = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if escaped:
+            escaped = False
+        elif ch == '\\':
+            escaped = True
+        elif ch == '"':
+            in_str = not in_str
+        elif not in_str:
+            if ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+    return None
+
+
+def _json_loads(text: str):
+    """Decode JSON with orjson when available, stdlib json otherwise.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    can catch the stdlib exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 class ScamDetectionResult:
     """Structured result from scam detection."""
     def __init__(
@@ -43,19 +99,13 @@ class ScamDetector:
     def __init__(self):
         self.patterns = RegexPatterns()
         self.keywords = ScamKeywords()
-        self._groq_client = None
-        
-        # Initialize Groq - try to enable LLM, but allow fallback
-        if config.GROQ_API_KEY:
-            try:
-                self._groq_client = Groq(api_key=config.GROQ_API_KEY)
-                logger.info("Scam detector: LLM mode enabled (Groq) with rule-based fallback")
-            except Exception as e:
-                logger.warning(f"Scam detector: Failed to initialize Groq: {e}. Will use rule-based fallback.")
-                self._groq_client = None
+
+        # Shared Groq client - try to enable LLM, but allow fallback
+        self._groq_client = get_sync_groq_client()
+        if self._groq_client:
+            logger.info("Scam detector: LLM mode enabled (Groq) with rule-based fallback")
         else:
-            logger.warning("Scam detector: GROQ_API_KEY not found - will use rule-based detection")
-            self._groq_client = None
+            logger.warning("Scam detector: Groq unavailable - will use rule-based detection")
     
     def detect_scam(
         self,
@@ -236,9 +286,20 @@ class ScamDetector:
                 conversation_history,
                 extracted_artifacts
             )
-            
-            # Use Groq API
-            response = self._groq_client.chat.completions.create(
+
+            # Identical prompts (repeated scammer scripts) reuse the cached
+            # verdict instead of another network round trip. Keyed on the
+            # exact prompt fingerprint; the model is fixed per process.
+            cache_key = ScamDetectionPrompts.fingerprint(prompt)
+            cached = llm_response_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
+            # Stream the completion so decode overlaps the network
+            # receive - the buffer is checked for a complete verdict
+            # object as chunks arrive instead of waiting for the
+            # final token.
+            stream = self._groq_client.chat.completions.create(
                 model=config.GROQ_MODEL,
                 messages=[
                     {"role": "user", "content": prompt}
@@ -246,10 +307,9 @@ class ScamDetector:
                 temperature=0.2,  # Low temperature for consistent analysis
                 max_tokens=200,
                 top_p=0.7,
+                stream=True,
             )
-            
-            # Parse JSON response
-            response_text = response.choices[0].message.content.strip()
+            response_text = self._consume_stream(stream)
             
             # Remove markdown code blocks if present
             if response_text.startswith("```"):
@@ -258,13 +318,17 @@ class ScamDetector:
                     response_text = response_text[4:]
                 response_text = response_text.strip()
             
-            # Try to extract JSON if wrapped in text
-            import re
-            json_match = re.search(r'\{[^{}]*"is_scam"[^{}]*\}', response_text, re.DOTALL)
-            if json_match:
-                response_text = json_match.group(0)
-            
-            llm_result = json.loads(response_text)
+            # Try to extract JSON if wrapped in text; fall back to the
+            # precompiled regex when the balanced-brace scan finds nothing
+            json_candidate = _extract_json_object(response_text)
+            if json_candidate is None:
+                json_match = _JSON_OBJ_RE.search(response_text)
+                if json_match:
+                    json_candidate = json_match.group(0)
+            if json_candidate:
+                response_text = json_candidate
+
+            llm_result = _json_loads(response_text)
             
             # Validate structure
             if not isinstance(llm_result, dict):
@@ -295,37 +359,47 @@ class ScamDetector:
                 llm_result["reason"] = llm_result["reason"][:197] + "..."
             
             logger.debug(f"LLM scam detection result: is_scam={llm_result.get('is_scam')}, confidence={llm_result.get('confidence')}")
+            llm_response_cache.set(cache_key, dict(llm_result))
             return llm_result
             
         except json.JSONDecodeError as e:
-            response_content = response.choices[0].message.content[:100] if 'response' in locals() and response.choices else 'N/A'
+            response_content = response_text[:100] if 'response_text' in locals() else 'N/A'
             logger.warning(f"Failed to parse LLM JSON response: {e}. Response: {response_content}")
             return None
         except Exception as e:
             logger.error(f"LLM scam detection error: {e}", exc_info=True)
             raise  # Re-raise to trigger fallback
-    
+
+    @staticmethod
+    def _consume_stream(stream) -> str:
+        """Accumulate a streamed completion into text.
+
+        Stops as soon as the buffer contains a balanced JSON object -
+        the verdict is all we need, so any trailing prose after the
+        closing brace isn't worth waiting for.
+        """
+        parts = []
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            parts.append(delta)
+            # Only re-scan when a closing brace could have completed
+            # the object
+            if '}' in delta and _extract_json_object(''.join(parts)):
+                stream.close()
+                break
+        return ''.join(parts).strip()
+
     def _extract_artifacts(self, text: str) -> Dict:
         """Extract artifacts (URLs, UPI IDs, phone numbers) for LLM context."""
-        artifacts = {
-            "urls": [],
-            "upi_ids": [],
-            "phone_numbers": []
+        return {
+            "urls": dedupe_preserve_order(self.patterns.URL.findall(text)),
+            "upi_ids": dedupe_preserve_order(self.patterns.UPI_ID.findall(text)),
+            "phone_numbers": dedupe_preserve_order(
+                self.patterns.PHONE_NUMBER.findall(text)
+            ),
         }
-        
-        # Extract URLs
-        url_matches = self.patterns.URL.findall(text)
-        artifacts["urls"] = list(set(url_matches))
-        
-        # Extract UPI IDs
-        upi_matches = self.patterns.UPI_ID.findall(text)
-        artifacts["upi_ids"] = list(set(upi_matches))
-        
-        # Extract phone numbers
-        phone_matches = self.patterns.PHONE_NUMBER.findall(text)
-        artifacts["phone_numbers"] = list(set(phone_matches))
-        
-        return artifacts
     
     def _quick_check(self, text: str) -> bool:
         """Quick check for scam indicators."""
@@ -3,6 +3,13 @@ from typing import Dict, Optional
 from datetime import datetime
 from app.models.session_state import SessionState, Message
 from app.models.intelligence import ExtractedIntelligence
+from app.utils.keyword_lists import ScamKeywords
+
+
+# Turns beyond this window are folded into session.historySummary so
+# prompt builders can send bounded history without losing all context.
+# Matches the persona prompt's 8-message window.
+_PROMPT_HISTORY_WINDOW = 8
 
 
 class SessionManager:
@@ -39,47 +46,95 @@ class SessionManager:
         session.conversationHistory.append(new_message)
         session.totalMessagesExchanged += 1
         session.lastUpdated = datetime.now()
-        
+
         # Update scam detection status
         if scam_detected is not None:
             session.scamDetected = scam_detected
         if scam_confidence is not None:
             session.scamConfidence = scam_confidence
         
-        # Merge extracted intelligence
+        # Merge extracted intelligence (set union - dedup comes for free)
         if intelligence:
-            session.extractedIntelligence.bankAccounts.extend(
+            session.extractedIntelligence.bankAccounts.update(
                 intelligence.bankAccounts
             )
-            session.extractedIntelligence.upiIds.extend(intelligence.upiIds)
-            session.extractedIntelligence.phishingLinks.extend(
+            session.extractedIntelligence.upiIds.update(intelligence.upiIds)
+            session.extractedIntelligence.phishingLinks.update(
                 intelligence.phishingLinks
             )
-            session.extractedIntelligence.phoneNumbers.extend(
+            session.extractedIntelligence.phoneNumbers.update(
                 intelligence.phoneNumbers
             )
-            session.extractedIntelligence.suspiciousKeywords.extend(
+            session.extractedIntelligence.suspiciousKeywords.update(
                 intelligence.suspiciousKeywords
             )
-            # Remove duplicates
-            session.extractedIntelligence.bankAccounts = list(
-                set(session.extractedIntelligence.bankAccounts)
-            )
-            session.extractedIntelligence.upiIds = list(
-                set(session.extractedIntelligence.upiIds)
-            )
-            session.extractedIntelligence.phishingLinks = list(
-                set(session.extractedIntelligence.phishingLinks)
-            )
-            session.extractedIntelligence.phoneNumbers = list(
-                set(session.extractedIntelligence.phoneNumbers)
-            )
-            session.extractedIntelligence.suspiciousKeywords = list(
-                set(session.extractedIntelligence.suspiciousKeywords)
-            )
-        
+
+        # Fold turns older than the prompt window into a compact summary
+        # (after the intelligence merge so it reflects this turn's finds)
+        self._update_history_summary(session)
+
         return session
-    
+
+    @staticmethod
+    def _update_history_summary(session: SessionState):
+        """Maintain a one-line summary of turns outside the prompt window.
+
+        Rule-based (no LLM call) - the goal is that prompt builders can
+        pass only the last few messages plus this line, keeping prompt
+        size O(window) regardless of conversation length. The line carries
+        what actually matters from the evicted turns - the topics the
+        scammer pushed and the artifacts they already surrendered - and is
+        left empty when there is nothing salient to retain.
+        """
+        history = session.conversationHistory
+        cutoff = len(history) - _PROMPT_HISTORY_WINDOW
+        if cutoff <= 0:
+            return
+
+        older = history[:cutoff]
+        scammer_count = sum(1 for m in older if m.sender == "scammer")
+
+        # Topics from the folded scammer turns - same suspicious-keyword
+        # list the extractor uses, in first-seen order
+        topics = []
+        seen = set()
+        for m in older:
+            if m.sender != "scammer":
+                continue
+            lowered = m.text.lower()
+            for kw in ScamKeywords.SUSPICIOUS_KEYWORDS:
+                if kw not in seen and kw in lowered:
+                    seen.add(kw)
+                    topics.append(kw)
+
+        intel = session.extractedIntelligence
+        surrendered = [
+            label
+            for label, values in (
+                ("a UPI ID", intel.upiIds),
+                ("a phone number", intel.phoneNumbers),
+                ("a link", intel.phishingLinks),
+                ("bank account details", intel.bankAccounts),
+            )
+            if values
+        ]
+
+        # A bare message count adds nothing to the persona prompt - only
+        # inject the line when it carries something the persona can use
+        if not topics and not surrendered:
+            session.historySummary = ""
+            return
+
+        summary = (
+            f"Earlier conversation ({len(older)} messages, "
+            f"{scammer_count} from the scammer)"
+        )
+        if topics:
+            summary += f": they pressed about {', '.join(topics[:5])}"
+        if surrendered:
+            summary += f"; they have already shared {', '.join(surrendered)}"
+        session.historySummary = summary + "."
+
     def add_agent_note(self, session_id: str, note: str):
         """Add a note about agent observations."""
         session = self.get_or_create_session(session_id)
@@ -1,15 +1,30 @@
 """Intelligence models."""
-from typing import List
+from typing import Dict, List, Set
 from pydantic import BaseModel, Field
 
 
 class ExtractedIntelligence(BaseModel):
-    """Structured intelligence extracted from conversations."""
-    bankAccounts: List[str] = Field(default_factory=list)
-    upiIds: List[str] = Field(default_factory=list)
-    phishingLinks: List[str] = Field(default_factory=list)
-    phoneNumbers: List[str] = Field(default_factory=list)
-    suspiciousKeywords: List[str] = Field(default_factory=list)
+    """Structured intelligence extracted from conversations.
+
+    Fields are sets so accumulation across turns is a plain union and
+    dedup is free; use to_dict() where stable list output is needed
+    (callback payloads, logs).
+    """
+    bankAccounts: Set[str] = Field(default_factory=set)
+    upiIds: Set[str] = Field(default_factory=set)
+    phishingLinks: Set[str] = Field(default_factory=set)
+    phoneNumbers: Set[str] = Field(default_factory=set)
+    suspiciousKeywords: Set[str] = Field(default_factory=set)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Return the intelligence as sorted lists for serialization."""
+        return {
+            "bankAccounts": sorted(self.bankAccounts),
+            "upiIds": sorted(self.upiIds),
+            "phishingLinks": sorted(self.phishingLinks),
+            "phoneNumbers": sorted(self.phoneNumbers),
+            "suspiciousKeywords": sorted(self.suspiciousKeywords),
+        }
 
 
 class GuviCallbackPayload(BaseModel):
@@ -48,6 +48,8 @@ class SessionState(BaseModel):
     totalMessagesExchanged: int = 0
     agentNotes: List[str] = Field(default_factory=list)
     conversationEnded: bool = Field(default=False, description="True when conversation is completed")
+    intelScannedThroughIndex: int = Field(default=0, description="History index already covered by intelligence extraction")
+    historySummary: str = Field(default="", description="Compact summary of turns older than the prompt window")
     callbackSent: bool = Field(default=False, description="True when callback has been sent")
     createdAt: datetime = Field(default_factory=datetime.now)
     lastUpdated: datetime = Field(default_factory=datetime.now)
@@ -1,4 +1,11 @@
 """Service for sending callbacks to GUVI evaluation endpoint."""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import requests
 from typing import List
 from app.models.session_state import SessionState, Message
@@ -7,6 +14,24 @@ from app.config import config
 from app.utils.logger import logger
 
 
+def _dumps_pretty(obj) -> str:
+    """Serialize for logging with orjson when available (stdlib fallback)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _dumps_body(obj) -> bytes:
+    """Serialize the HTTP request body straight to UTF-8 bytes.
+
+    orjson emits bytes natively; passing them to requests as `data`
+    skips the dict->str->bytes round trip that `json=` would do.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
 class CallbackService:
     """Handles callbacks to GUVI evaluation endpoint."""
     
@@ -61,22 +86,22 @@ class CallbackService:
         
         # Phone numbers - emphasized
         if intelligence.phoneNumbers:
-            summary_parts.append(f"  Phone Numbers ({len(intelligence.phoneNumbers)}): {', '.join(intelligence.phoneNumbers)}")
+            summary_parts.append(f"  Phone Numbers ({len(intelligence.phoneNumbers)}): {', '.join(sorted(intelligence.phoneNumbers))}")
         else:
             summary_parts.append("  Phone Numbers: None detected")
         
         # Other intelligence
         if intelligence.upiIds:
-            summary_parts.append(f"  UPI IDs ({len(intelligence.upiIds)}): {', '.join(intelligence.upiIds[:5])}{'...' if len(intelligence.upiIds) > 5 else ''}")
+            summary_parts.append(f"  UPI IDs ({len(intelligence.upiIds)}): {', '.join(sorted(intelligence.upiIds)[:5])}{'...' if len(intelligence.upiIds) > 5 else ''}")
         
         if intelligence.bankAccounts:
             summary_parts.append(f"  Bank Accounts ({len(intelligence.bankAccounts)}): {len(intelligence.bankAccounts)} account(s) detected")
         
         if intelligence.phishingLinks:
-            summary_parts.append(f"  Phishing Links ({len(intelligence.phishingLinks)}): {', '.join(intelligence.phishingLinks[:3])}{'...' if len(intelligence.phishingLinks) > 3 else ''}")
+            summary_parts.append(f"  Phishing Links ({len(intelligence.phishingLinks)}): {', '.join(sorted(intelligence.phishingLinks)[:3])}{'...' if len(intelligence.phishingLinks) > 3 else ''}")
         
         if intelligence.suspiciousKeywords:
-            summary_parts.append(f"  Suspicious Keywords: {', '.join(intelligence.suspiciousKeywords[:10])}{'...' if len(intelligence.suspiciousKeywords) > 10 else ''}")
+            summary_parts.append(f"  Suspicious Keywords: {', '.join(sorted(intelligence.suspiciousKeywords)[:10])}{'...' if len(intelligence.suspiciousKeywords) > 10 else ''}")
         
         # 5. Why it's a scam - synthesize from all available information
         summary_parts.append("\nSCAM INDICATORS IDENTIFIED:")
@@ -142,10 +167,14 @@ class CallbackService:
             agentNotes=agent_notes_summary
         )
         
-        # Print the request that will be sent to GUVI
-        import json
-        payload_dict = payload.model_dump()
-        
+        # Print the request that will be sent to GUVI.
+        # model_dump serializes the intelligence sets in arbitrary
+        # iteration order; substitute the sorted-list form so the wire
+        # payload (and the logged copy) is deterministic run-to-run.
+        payload_dict = payload.model_dump(mode="json")
+        payload_dict["extractedIntelligence"] = payload.extractedIntelligence.to_dict()
+        payload_pretty = _dumps_pretty(payload_dict)
+
         print("\n" + "="*80)
         print("📤 GUVI CALLBACK REQUEST")
         print("="*80)
@@ -153,23 +182,24 @@ class CallbackService:
         print(f"Method: POST")
         print(f"Headers: {{'Content-Type': 'application/json'}}")
         print("\nPayload:")
-        print(json.dumps(payload_dict, indent=2, ensure_ascii=False))
+        print(payload_pretty)
         print("="*80 + "\n")
-        
+
         logger.info("="*80)
         logger.info("📤 GUVI CALLBACK REQUEST")
         logger.info("="*80)
         logger.info(f"URL: {self.callback_url}")
         logger.info("Method: POST")
         logger.info("Headers: {'Content-Type': 'application/json'}")
-        logger.info("Payload:\n" + json.dumps(payload_dict, indent=2, ensure_ascii=False))
+        logger.info("Payload:\n" + payload_pretty)
         logger.info("="*80)
         
-        # Send callback to GUVI endpoint
+        # Send callback to GUVI endpoint - body pre-encoded to bytes so
+        # requests doesn't serialize and encode the dict itself
         try:
             response = requests.post(
                 self.callback_url,
-                json=payload_dict,
+                data=_dumps_body(payload_dict),
                 headers={"Content-Type": "application/json"},
                 timeout=10
             )
@@ -223,15 +253,13 @@ class CallbackService:
         
         # Check if we have meaningful intelligence
         intelligence = session.extractedIntelligence
-        has_intelligence = (
-            len(intelligence.bankAccounts) > 0 or
-            len(intelligence.upiIds) > 0 or
-            len(intelligence.phishingLinks) > 0 or
-            len(intelligence.phoneNumbers) > 0 or
-            len(intelligence.suspiciousKeywords) > 0
+        return bool(
+            intelligence.bankAccounts
+            or intelligence.upiIds
+            or intelligence.phishingLinks
+            or intelligence.phoneNumbers
+            or intelligence.suspiciousKeywords
         )
-        
-        return has_intelligence
 
 
 # Global callback service instance
@@ -0,0 +1,25 @@
+"""Small shared helpers."""
+from typing import Iterable, List
+
+
+def trim_middle(text: str, limit: int = 500) -> str:
+    """Bound text to ~limit chars, keeping the head and tail.
+
+    A pathological multi-KB message would otherwise blow out both
+    prompt-build cost and the LLM context window; the middle is replaced
+    with a marker noting how many characters were dropped.
+    """
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    return f"{text[:half]}…[{len(text) - limit} chars truncated]…{text[-half:]}"
+
+
+def dedupe_preserve_order(items: Iterable[str]) -> List[str]:
+    """Deduplicate items keeping first-seen order.
+
+    dict.fromkeys does the whole pass in C with insertion-ordered keys -
+    cheaper than a Python-level seen-set loop, and unlike list(set(...))
+    it keeps the original ordering.
+    """
+    return list(dict.fromkeys(items))
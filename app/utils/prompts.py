@@ -5,14 +5,63 @@ This module contains all prompts used by different agents in the honeypot system
 Prompts are organized by agent for easy maintenance and updates.
 """
 
-from typing import Dict
+import hashlib
+import re
+import sys
+from functools import lru_cache
+from operator import attrgetter
+from string import Template
+from typing import Dict, Final, Sequence
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+from app.models.session_state import Message
 from app.models.strategy import ConversationGoal
+from app.utils.helpers import trim_middle
+
+
+# C-level extraction of (sender, text) pairs for the history loops -
+# one C call per message instead of two LOAD_ATTR dispatches.
+_SENDER_TEXT = attrgetter("sender", "text")
 
 
 # ============================================================================
 # STRATEGY AGENT PROMPTS
 # ============================================================================
 
+# Conversation-end detection prompt as a Template built once at import:
+# substitute() walks a pre-parsed token list per call instead of
+# re-interpreting a multi-KB f-string literal. Static instruction block
+# first, dynamic turn data last (prefix-cache friendly).
+_END_DETECTION_TEMPLATE: Final[Template] = Template("""You are analyzing a conversation with a scammer.
+
+Your ONLY task:
+Decide if the scammer is clearly trying to END the conversation.
+
+STRICT RULES:
+- Answer "NO" if the scammer is asking for anything (verification, UPI, links, actions).
+- Answer "NO" if the scammer is making threats or demands.
+- Answer "YES" ONLY if the scammer clearly says goodbye, thanks, or indicates the conversation is finished.
+
+Examples:
+- "Thanks, goodbye" → YES
+- "Okay, that's all" → YES
+- "Send your UPI now" → NO
+- "Click this link to verify" → NO
+
+Is the scammer ending the conversation?
+Answer ONLY with "YES" or "NO".
+
+Conversation length: $message_count
+Extracted UPI IDs: $upi_count
+Extracted links: $link_count
+
+Current message:
+"$message_text\"""")
+
+
 class StrategyAgentPrompts:
     """Prompts for the Strategy Agent (conversation end detection)."""
     
@@ -42,37 +91,37 @@ class StrategyAgentPrompts:
         Returns:
             Formatted prompt string
         """
-        return f"""You are analyzing a conversation with a scammer.
-
-Your ONLY task:
-Decide if the scammer is clearly trying to END the conversation.
+        return _END_DETECTION_TEMPLATE.substitute(
+            message_count=message_count,
+            upi_count=upi_count,
+            link_count=link_count,
+            message_text=trim_middle(message_text),
+        )
 
-STRICT RULES:
-- Answer "NO" if the scammer is asking for anything (verification, UPI, links, actions).
-- Answer "NO" if the scammer is making threats or demands.
-- Answer "YES" ONLY if the scammer clearly says goodbye, thanks, or indicates the conversation is finished.
 
-Examples:
-- "Thanks, goodbye" → YES
-- "Okay, that's all" → YES
-- "Send your UPI now" → NO
-- "Click this link to verify" → NO
-
-Current message:
-"{message_text}"
+# ============================================================================
+# PERSONA AGENT PROMPTS
+# ============================================================================
 
-Conversation length: {message_count}
-Extracted UPI IDs: {upi_count}
-Extracted links: {link_count}
+# Pure-literal tail of the persona context: adjacent literals are folded
+# into one constant at compile time, so the builder ends with a single
+# concatenation instead of interpolating through another f-string.
+_PERSONA_TAIL: Final[str] = (
+    "\n\n"
+    "Your response (be natural, varied, and don't repeat previous responses):"
+)
 
-Is the scammer ending the conversation?
 
-Answer ONLY with "YES" or "NO"."""
+@lru_cache(maxsize=16)
+def _persona_static_prefix(system_prompt: str) -> str:
+    """Static head of the persona conversation context.
 
+    There is one distinct system prompt per conversation goal, so this
+    memoizes the scaffold (system prompt + few-shot examples) instead of
+    re-concatenating the same multi-KB block on every response.
+    """
+    return system_prompt + "\n\n" + PersonaAgentPrompts.EXAMPLE_REPLIES + "\n"
 
-# ============================================================================
-# PERSONA AGENT PROMPTS
-# ============================================================================
 
 class PersonaAgentPrompts:
     """Prompts for the Persona Agent (human-like response generation)."""
@@ -112,99 +161,120 @@ STYLE EXAMPLES:
 - "I don't usually do this online. Can you tell me more?"
 
 Return ONLY the reply text. Do not include explanations."""
-    
-    @staticmethod
-    def get_goal_instruction(goal: ConversationGoal) -> str:
-        """
-        Get goal-specific behavior hint for the persona agent.
-        Returns concise behavior instructions without intelligence awareness.
-        
-        Args:
-            goal: Conversation goal (CLARIFY, DELAY, ESCALATE, CONTINUE, WRAP_UP)
-            
-        Returns:
-            Goal-specific behavior hint string
-        """
-        goal_instructions: Dict[ConversationGoal, str] = {
-            ConversationGoal.CLARIFY: """
+
+    # Few-shot examples for tone & length (static block, built once)
+    EXAMPLE_REPLIES = """Example replies (tone & length):
+- "I'm not sure why this is happening. Can you explain?"
+- "This sounds worrying. What exactly do I need to do?"
+- "I don't usually click links. Can you tell me more?"
+- "I need some time to check this. Please wait."
+"""
+
+    # Goal-specific behavior hints, built once at class definition so
+    # get_goal_instruction is a plain dict lookup per call.
+    GOAL_INSTRUCTIONS: Dict[ConversationGoal, str] = {
+        ConversationGoal.CLARIFY: """
 Current goal: Ask for clarification.
 - Ask one simple question.
 - Show mild concern or confusion.
 - Do not agree to any action.
 """,
-            
-            ConversationGoal.DELAY: """
+
+        ConversationGoal.DELAY: """
 Current goal: Delay politely.
 - Say you need time or need to check.
 - Keep tone calm and reasonable.
 """,
-            
-            ConversationGoal.ESCALATE: """
+
+        ConversationGoal.ESCALATE: """
 Current goal: Show increased concern.
 - Express worry.
 - Ask what needs to be done.
 - Do not commit to anything.
 """,
-            
-            ConversationGoal.CONTINUE: """
+
+        ConversationGoal.CONTINUE: """
 Current goal: Continue the conversation naturally.
 - Respond briefly.
 - Ask a relevant follow-up if needed.
 """,
-            
-            ConversationGoal.WRAP_UP: """
+
+        ConversationGoal.WRAP_UP: """
 Current goal: End the conversation politely.
 - Be firm but respectful.
 - Example: "I'll check with my bank directly. Thank you."
 """
-        }
-        
-        return goal_instructions.get(goal, goal_instructions[ConversationGoal.CONTINUE])
+    }
+
+    @staticmethod
+    def get_goal_instruction(goal: ConversationGoal) -> str:
+        """
+        Get goal-specific behavior hint for the persona agent.
+        Returns concise behavior instructions without intelligence awareness.
+
+        Args:
+            goal: Conversation goal (CLARIFY, DELAY, ESCALATE, CONTINUE, WRAP_UP)
+
+        Returns:
+            Goal-specific behavior hint string
+        """
+        instructions = PersonaAgentPrompts.GOAL_INSTRUCTIONS
+        return instructions.get(goal, instructions[ConversationGoal.CONTINUE])
     
     @staticmethod
     def build_conversation_context(
         system_prompt: str,
-        conversation_history: list,
-        current_message: str
+        conversation_history: Sequence[Message],
+        current_message: str,
+        history_summary: str = ""
     ) -> str:
         """
         Build the full conversation context for the LLM.
         Includes few-shot examples for better human-likeness.
-        
+
         Args:
             system_prompt: Base system prompt with goal instructions
             conversation_history: List of previous messages
             current_message: Current message from scammer
-            
+            history_summary: Compact summary of turns older than the window
+
         Returns:
             Full conversation context string
         """
-        context = system_prompt + "\n\n"
+        # Static blocks first (system prompt + few-shot examples), dynamic
+        # conversation last - keeps the prompt prefix stable across turns
+        # of a session so provider-side prefix caching can hit. The
+        # scaffold itself is memoized per system prompt.
+        context = _persona_static_prefix(system_prompt)
+
+        # Summary stands in for the turns trimmed from the window below,
+        # so long conversations keep context without unbounded prompts
+        if history_summary:
+            context += history_summary + "\n\n"
+
+        # Add conversation history (last 8 messages to avoid token limits).
+        # Build the lines as a list and join once - repeated += on a str
+        # reallocates the buffer every iteration.
+        # Normalize once so the window slice below is O(window) even if
+        # a caller hands us a deque or other lazily-sliceable sequence
+        if not isinstance(conversation_history, (list, tuple)):
+            conversation_history = list(conversation_history or ())
+        history_tail = conversation_history[-8:]
+        if history_tail:
+            lines = [
+                f"Scammer: {trim_middle(text)}" if sender == "scammer"
+                else f"You: {trim_middle(text)}"
+                for sender, text in map(_SENDER_TEXT, history_tail)
+            ]
+            context += "Previous conversation:\n" + "\n".join(lines) + "\n\n"
         
-        # Add few-shot examples for tone & length
-        context += """Example replies (tone & length):
-- "I'm not sure why this is happening. Can you explain?"
-- "This sounds worrying. What exactly do I need to do?"
-- "I don't usually click links. Can you tell me more?"
-- "I need some time to check this. Please wait."
-"""
-        context += "\n"
-        
-        # Add conversation history (last 8 messages to avoid token limits)
-        if conversation_history:
-            context += "Previous conversation:\n"
-            for msg in conversation_history[-8:]:  # Last 8 messages for context
-                if msg.sender == "scammer":
-                    context += f"Scammer: {msg.text}\n"
-                else:
-                    context += f"You: {msg.text}\n"
-            context += "\n"
-        
-        # Add current message
-        context += f"Current message from scammer: {current_message}\n\n"
-        context += "Your response (be natural, varied, and don't repeat previous responses):"
-        
-        return context
+        # Add current message; literal tail is one precompiled constant
+        return (
+            context
+            + "Current message from scammer: "
+            + trim_middle(current_message)
+            + _PERSONA_TAIL
+        )
 
 
 # ============================================================================
@@ -272,101 +342,133 @@ class FallbackResponses:
 class ForbiddenPhrases:
     """Phrases that should NEVER appear in persona responses."""
     
-    FORBIDDEN = [
-        "I am an AI",
-        "I'm a bot",
-        "I'm an AI",
+    # Stored pre-lowercased and frozen: matching is always
+    # case-insensitive, so consumers never need to normalize the
+    # phrases per check, and membership tests are O(1).
+    FORBIDDEN: Final[frozenset] = frozenset({
+        "i am an ai",
+        "i'm a bot",
+        "i'm an ai",
         "detection system",
         "honeypot",
-        "I'm detecting",
-        "I'm analyzing",
+        "i'm detecting",
+        "i'm analyzing",
         "intelligence",
         "gathered intelligence",
         "extracted",
         "confidence score",
         "rule-based",
         "scam detection",
-        "I'm a system",
+        "i'm a system",
         "automated",
-        "algorithm"
-    ]
-    
+        "algorithm",
+    })
+
     # Phrases that reveal meta-awareness
-    META_PHRASES = [
+    META_PHRASES: Final[frozenset] = frozenset({
         "we've already",
         "we have gathered",
         "we extracted",
         "our system",
         "the system",
         "detection",
-        "analysis"
-    ]
+        "analysis",
+    })
+
+    @staticmethod
+    def contains_any(text: str) -> bool:
+        """True if text contains any forbidden or meta phrase.
+
+        Case-insensitive. One automaton pass over the text instead of
+        one substring scan per phrase; callers should prefer this over
+        iterating FORBIDDEN/META_PHRASES themselves.
+        """
+        if _FORBIDDEN_AC is not None:
+            return next(_FORBIDDEN_AC.iter(text.lower()), None) is not None
+        return _FORBIDDEN_RE.search(text) is not None
+
+    @staticmethod
+    def search(text: str):
+        """Return the forbidden/meta phrase found in text, or None.
+
+        Case-insensitive single regex pass; the alternation is sorted
+        longest-first so overlapping phrases report the most specific
+        match. Use this when the caller needs the offending phrase
+        (e.g. for an error message), contains_any() when a bool is
+        enough.
+        """
+        m = _FORBIDDEN_RE.search(text)
+        return m.group(0).lower() if m else None
+
+
+# All phrases the persona must never emit, matched together. Built once
+# at import: an Aho-Corasick automaton when pyahocorasick is available
+# (single O(N) pass for all ~25 phrases), otherwise one compiled regex
+# alternation - either way no Python-level loop per check.
+_ALL_FORBIDDEN = tuple(ForbiddenPhrases.FORBIDDEN | ForbiddenPhrases.META_PHRASES)
+
+_FORBIDDEN_AC = None
+if ahocorasick is not None:
+    _FORBIDDEN_AC = ahocorasick.Automaton()
+    for _phrase in _ALL_FORBIDDEN:
+        _FORBIDDEN_AC.add_word(_phrase, _phrase)
+    _FORBIDDEN_AC.make_automaton()
+
+_FORBIDDEN_RE = re.compile(
+    "|".join(sorted(map(re.escape, _ALL_FORBIDDEN), key=len, reverse=True)),
+    re.IGNORECASE,
+)
 
 
 class AllowedFillers:
-    """Casual fillers that make responses more human-like."""
-    
-    HESITATION = [
+    """Casual fillers that make responses more human-like.
+
+    Tuples rather than frozensets: consumers pick fillers with
+    random.choice, which needs an indexable sequence, and immutability
+    still guards against accidental mutation.
+    """
+
+    HESITATION: Final[tuple] = (
         "um", "uh", "hmm", "well", "actually", "I mean", "you know"
-    ]
-    
-    POLITE = [
+    )
+
+    POLITE: Final[tuple] = (
         "please", "sorry", "excuse me", "if you don't mind", "I hope"
-    ]
-    
-    UNCERTAINTY = [
-        "I think", "I guess", "maybe", "perhaps", "I'm not sure", 
+    )
+
+    UNCERTAINTY: Final[tuple] = (
+        "I think", "I guess", "maybe", "perhaps", "I'm not sure",
         "I don't know", "kind of", "sort of"
-    ]
+    )
 
 
 # ============================================================================
 # SCAM DETECTION LLM FALLBACK PROMPTS
 # ============================================================================
 
-class ScamDetectionPrompts:
-    """Prompts for LLM-only scam detection."""
-    
-    @staticmethod
-    def get_llm_scam_detection_prompt(
-        message_text: str,
-        conversation_history: list,
-        extracted_artifacts: dict
-    ) -> str:
-        """
-        Get the prompt for LLM-only scam detection.
-        
-        Args:
-            message_text: Current message to analyze
-            conversation_history: Last N messages in conversation
-            extracted_artifacts: Dict with URLs, UPI IDs, phone numbers found
-            
-        Returns:
-            Formatted prompt string for structured JSON response
-        """
-        history_context = ""
-        if conversation_history:
-            history_context = "\n\nRecent conversation history:\n"
-            for msg in conversation_history[-3:]:
-                history_context += f"- {msg.sender}: {msg.text}\n"
-        
-        artifacts_context = ""
-        if extracted_artifacts:
-            artifacts_context = "\n\nExtracted artifacts from message:\n"
-            if extracted_artifacts.get("urls"):
-                artifacts_context += f"- URLs: {', '.join(extracted_artifacts['urls'])}\n"
-            if extracted_artifacts.get("upi_ids"):
-                artifacts_context += f"- UPI IDs: {', '.join(extracted_artifacts['upi_ids'])}\n"
-            if extracted_artifacts.get("phone_numbers"):
-                artifacts_context += f"- Phone numbers: {', '.join(extracted_artifacts['phone_numbers'])}\n"
-        
-        return f"""You are a security analyst evaluating a suspicious message for scam intent.
-
-Message to analyze:
-"{message_text}"
-{history_context}{artifacts_context}
-
-Your task: Determine if this message is a SCAM.
+# Static bodies of the scam-detection prompts, frozen at import. Keeping
+# them as plain module constants means each call does a few joins instead
+# of re-materializing a multi-KB f-string (and re-processing its escaped
+# braces) per detection. The entire static block comes FIRST and the
+# dynamic content (message, history, artifacts) is appended at the end:
+# provider-side prompt caching only matches on a byte-identical prefix,
+# so a stable multi-KB head maximizes cache hits across detections.
+
+# The verdict schema is a single interned constant shared by both
+# builders: one copy of the bytes process-wide, and the schema section
+# of both prompts stays byte-identical.
+_SCAM_VERDICT_SCHEMA: Final[str] = sys.intern(
+    'Return ONLY valid JSON in this EXACT format:\n'
+    '{\n'
+    '  "is_scam": true or false,\n'
+    '  "confidence": 0.0-1.0,\n'
+    '  "reason": "brief explanation (max 50 words)"\n'
+    '}\n'
+)
+
+_DETECTION_STATIC: Final[str] = """You are a security analyst evaluating a suspicious message for scam intent.
+
+Your task: Determine if the message below is a SCAM.
 
 SCAM INDICATORS TO LOOK FOR:
 - Urgency or threats (blocked account, immediate action required, time-sensitive)
@@ -384,13 +486,7 @@ LEGITIMATE MESSAGES:
 - Customer support follow-ups
 - Casual social messages
 
-Return ONLY valid JSON in this EXACT format:
-{{
-  "is_scam": true or false,
-  "confidence": 0.0-1.0,
-  "reason": "brief explanation (max 50 words)"
-}}
-
+""" + _SCAM_VERDICT_SCHEMA + """
 Guidelines:
 - Mark as scam (is_scam=true) if message shows clear scam intent
 - Mark as not scam (is_scam=false) if message is legitimate or unclear
@@ -402,12 +498,113 @@ Guidelines:
   * 0.0-0.3: Very low confidence (likely legitimate)
 - Reason should be specific and explainable
 
-JSON response:"""
+---
+Message to analyze:
+"""
+
+_FALLBACK_STATIC: Final[str] = """You are a security analyst reviewing a suspicious message whose rule-based score was AMBIGUOUS.
+
+Task:
+Decide if the message below is a SCAM.
+
+""" + _SCAM_VERDICT_SCHEMA + """
+Guidelines:
+- Mark as scam if there is urgency, threats, sensitive data requests, or phishing behavior.
+- Mark as not scam if message is informational or unclear.
+- Use confidence ≥ 0.7 only when clearly sure.
+
+---
+"""
+
+
+# Shared immutable default for dict lookups - never allocates a fresh
+# container per miss the way .get(key, []) would, and it's safe to share
+# since tuples can't be mutated by callers.
+_EMPTY: Final[tuple] = ()
+
+
+def _build_artifacts_context(extracted_artifacts: dict) -> str:
+    """Format the extracted-artifacts block shared by both builders.
+
+    Appends to a parts list and joins once instead of growing a string
+    per artifact type; returns "" when there are no artifacts at all.
+    """
+    if not extracted_artifacts:
+        return ""
+    parts = ["\n\nExtracted artifacts from message:\n"]
+    urls = extracted_artifacts.get("urls", _EMPTY)
+    if urls:
+        parts.append(f"- URLs: {', '.join(urls)}\n")
+    upi_ids = extracted_artifacts.get("upi_ids", _EMPTY)
+    if upi_ids:
+        parts.append(f"- UPI IDs: {', '.join(upi_ids)}\n")
+    phone_numbers = extracted_artifacts.get("phone_numbers", _EMPTY)
+    if phone_numbers:
+        parts.append(f"- Phone numbers: {', '.join(phone_numbers)}\n")
+    return "".join(parts) if len(parts) > 1 else ""
+
+
+class ScamDetectionPrompts:
+    """Prompts for LLM-only scam detection."""
+
+    @staticmethod
+    def fingerprint(prompt: str) -> str:
+        """Deterministic SHA-256 fingerprint of a fully built prompt.
+
+        Intended as the cache key for LLM responses: identical prompts
+        (repeated scammer scripts, replays, test runs) hash to the same
+        key, turning a network round trip into a dict lookup.
+        """
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_llm_scam_detection_prompt(
+        message_text: str,
+        conversation_history: Sequence[Message],
+        extracted_artifacts: dict
+    ) -> str:
+        """
+        Get the prompt for LLM-only scam detection.
+        
+        Args:
+            message_text: Current message to analyze
+            conversation_history: Last N messages in conversation
+            extracted_artifacts: Dict with URLs, UPI IDs, phone numbers found
+            
+        Returns:
+            Formatted prompt string for structured JSON response
+        """
+        # Normalize to a concrete list/tuple, then slice the tail once -
+        # keeps the window O(window) even for deque-like sequences
+        if conversation_history is None:
+            conversation_history = ()
+        elif not isinstance(conversation_history, (list, tuple)):
+            conversation_history = list(conversation_history)
+        history_tail = conversation_history[-3:]
+        history_context = ""
+        if history_tail:
+            # One join instead of per-message str concatenation
+            history_context = "\n\nRecent conversation history:\n" + "\n".join(
+                f"- {sender}: {trim_middle(text)}"
+                for sender, text in map(_SENDER_TEXT, history_tail)
+            ) + "\n"
+
+        artifacts_context = _build_artifacts_context(extracted_artifacts)
+
+        # Static block first, dynamic content last (see the constant
+        # definitions above for why)
+        return "".join((
+            _DETECTION_STATIC,
+            '"', trim_middle(message_text), '"\n',
+            history_context,
+            artifacts_context,
+            "\nJSON response:",
+        ))
     
     @staticmethod
     def get_llm_fallback_prompt(
         message_text: str,
-        conversation_history: list,
+        conversation_history: Sequence[Message],
         rule_score: float,
         rule_evidence: list[str],
         extracted_artifacts: dict
@@ -425,46 +622,36 @@ JSON response:"""
         Returns:
             Formatted prompt string for structured JSON response
         """
+        # Normalize to a concrete list/tuple, then slice the tail once -
+        # keeps the window O(window) even for deque-like sequences
+        if conversation_history is None:
+            conversation_history = ()
+        elif not isinstance(conversation_history, (list, tuple)):
+            conversation_history = list(conversation_history)
+        history_tail = conversation_history[-3:]
         history_context = ""
-        if conversation_history:
-            history_context = "\n\nRecent conversation history:\n"
-            for msg in conversation_history[-3:]:
-                history_context += f"- {msg.sender}: {msg.text}\n"
-        
-        artifacts_context = ""
-        if extracted_artifacts:
-            artifacts_context = "\n\nExtracted artifacts from message:\n"
-            if extracted_artifacts.get("urls"):
-                artifacts_context += f"- URLs: {', '.join(extracted_artifacts['urls'])}\n"
-            if extracted_artifacts.get("upi_ids"):
-                artifacts_context += f"- UPI IDs: {', '.join(extracted_artifacts['upi_ids'])}\n"
-            if extracted_artifacts.get("phone_numbers"):
-                artifacts_context += f"- Phone numbers: {', '.join(extracted_artifacts['phone_numbers'])}\n"
+        if history_tail:
+            # One join instead of per-message str concatenation
+            history_context = "\n\nRecent conversation history:\n" + "\n".join(
+                f"- {sender}: {trim_middle(text)}"
+                for sender, text in map(_SENDER_TEXT, history_tail)
+            ) + "\n"
+
+        artifacts_context = _build_artifacts_context(extracted_artifacts)
         
-        return f"""You are a security analyst reviewing a suspicious message.
-
-The rule-based system produced an AMBIGUOUS score: {rule_score:.2f}
-
-Rule indicators found:
-{chr(10).join(f'- {e}' for e in rule_evidence)}
-
-Message:
-"{message_text}"
-{history_context}{artifacts_context}
-
-Task:
-Decide if this message is a SCAM.
-
-Return ONLY valid JSON in this EXACT format:
-{{
-  "is_scam": true or false,
-  "confidence": 0.0-1.0,
-  "reason": "short explanation (max 30 words)"
-}}
-
-Guidelines:
-- Mark as scam if there is urgency, threats, sensitive data requests, or phishing behavior.
-- Mark as not scam if message is informational or unclear.
-- Use confidence ≥ 0.7 only when clearly sure.
-
-JSON response:"""
+        # Plain "- " + e concatenation: the items are already strings,
+        # so this skips the __format__ dispatch an f-string would do
+        evidence_block = "\n".join("- " + e for e in rule_evidence)
+
+        # Static block first, dynamic content last (see the constant
+        # definitions above for why)
+        return "".join((
+            _FALLBACK_STATIC,
+            f"Rule-based score: {rule_score:.2f}\n\n",
+            "Rule indicators found:\n",
+            evidence_block,
+            '\n\nMessage:\n"', trim_middle(message_text), '"\n',
+            history_context,
+            artifacts_context,
+            "\nJSON response:",
+        ))
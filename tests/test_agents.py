@@ -1,4 +1,6 @@
 """Tests for agents."""
+import asyncio
+
 import pytest
 from app.models.session_state import Message, SessionState
 from app.models.intelligence import ExtractedIntelligence
@@ -40,7 +42,7 @@ def test_strategy_agent_should_continue():
         timestamp="2026-01-21T10:15:30Z"
     )
     
-    should_continue = agent.should_continue_engagement(session, message)
+    should_continue = asyncio.run(agent.should_continue_engagement(session, message))
     
     assert should_continue is True
 
@@ -0,0 +1,83 @@
+"""Tests for the LLM micro-batching queue."""
+import asyncio
+
+from app.core.llm_batcher import LLMBatcher
+
+
+class _FakeCompletions:
+    """Stand-in for client.chat.completions with a fixed latency."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def create(self, **params):
+        await asyncio.sleep(self.delay)
+        return params
+
+
+class _FakeClient:
+    def __init__(self, delay: float = 0.0):
+        self.chat = type("Chat", (), {})()
+        self.chat.completions = _FakeCompletions(delay)
+
+
+def test_late_call_not_blocked_by_inflight_batch():
+    """A call arriving mid-batch must not wait out the batch's round trip."""
+
+    async def run():
+        batcher = LLMBatcher(batch_window=0.005, max_batch=8)
+        client = _FakeClient(delay=0.2)
+        loop = asyncio.get_running_loop()
+
+        first = asyncio.create_task(batcher.submit(client, call="first"))
+        # Let the first batch dispatch, then submit while it is in flight
+        await asyncio.sleep(0.05)
+        start = loop.time()
+        await batcher.submit(client, call="second")
+        return loop.time() - start, await first
+
+    elapsed, first_result = asyncio.run(run())
+    assert first_result == {"call": "first"}
+    # Second call should take ~its own 0.2s round trip, not first's too
+    assert elapsed < 0.35
+
+
+def test_idle_exit_does_not_strand_queued_item():
+    """An item enqueued as the worker times out must still be dispatched."""
+
+    async def run():
+        batcher = LLMBatcher(batch_window=0.005, max_batch=8)
+        client = _FakeClient()
+
+        # Drive the worker to its idle timeout, then race a submit in
+        # while the (done-but-not-observed) worker is winding down
+        await batcher.submit(client, call="warmup")
+        await asyncio.sleep(1.05)
+        return await asyncio.wait_for(
+            batcher.submit(client, call="raced"), timeout=2.0
+        )
+
+    assert asyncio.run(run()) == {"call": "raced"}
+
+
+def test_exception_propagates_to_caller():
+    """Failures inside a batch surface on the caller's future."""
+
+    class _BoomCompletions:
+        async def create(self, **params):
+            raise RuntimeError("boom")
+
+    class _BoomClient:
+        def __init__(self):
+            self.chat = type("Chat", (), {})()
+            self.chat.completions = _BoomCompletions()
+
+    async def run():
+        batcher = LLMBatcher()
+        try:
+            await batcher.submit(_BoomClient(), call="fails")
+        except RuntimeError as e:
+            return str(e)
+        return None
+
+    assert asyncio.run(run()) == "boom"
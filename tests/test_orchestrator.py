@@ -0,0 +1,76 @@
+"""Tests for the orchestrator's intelligence-extraction watermark."""
+import asyncio
+
+from app.core import orchestrator as orchestrator_module
+from app.core.orchestrator import Orchestrator
+from app.core.session_manager import session_manager
+from app.models.session_state import Message, SessionState
+from app.models.strategy import StrategyDecision, ConversationGoal
+
+
+class _FakeStrategy:
+    async def decide_strategy(self, session, message):
+        return StrategyDecision(
+            should_engage=True,
+            goal=ConversationGoal.CONTINUE,
+            reasoning="test"
+        )
+
+
+class _FakePersona:
+    async def generate_response(self, message, history, decision, history_summary=""):
+        return "Why is my account blocked?"
+
+
+def _make_orchestrator():
+    orch = Orchestrator()
+    orch.strategy_agent = _FakeStrategy()
+    orch.persona_agent = _FakePersona()
+    return orch
+
+
+def _make_session(session_id):
+    session = SessionState(sessionId=session_id, scamDetected=True)
+    # Register so update_session mutates this same object
+    session_manager.sessions[session_id] = session
+    return session
+
+
+def test_watermark_advances_on_successful_extraction():
+    session = _make_session("wm-ok")
+    message = Message(
+        sender="scammer",
+        text="Pay to fraud@ybl now.",
+        timestamp="2026-01-21T10:15:30Z"
+    )
+
+    response = asyncio.run(_make_orchestrator().process_message(message, session))
+
+    assert response is not None
+    assert "fraud@ybl" in session.extractedIntelligence.upiIds
+    assert session.intelScannedThroughIndex == len(session.conversationHistory)
+
+
+def test_watermark_not_advanced_on_extraction_failure(monkeypatch):
+    session = _make_session("wm-fail")
+    message = Message(
+        sender="scammer",
+        text="Pay to fraud@ybl now.",
+        timestamp="2026-01-21T10:15:30Z"
+    )
+
+    def _boom(*args, **kwargs):
+        raise RuntimeError("extractor down")
+
+    monkeypatch.setattr(
+        orchestrator_module.intelligence_aggregator,
+        "extract_intelligence",
+        _boom
+    )
+
+    asyncio.run(_make_orchestrator().process_message(message, session))
+
+    # The failed turn must stay below the watermark so its artifacts are
+    # re-scanned on the next successful extraction
+    assert session.intelScannedThroughIndex == 0
+    assert not session.extractedIntelligence.upiIds